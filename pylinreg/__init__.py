@@ -27,9 +27,7 @@ __status__ = 'Alpha'
 
 
 # import section
-from importlib import import_module
 from ._pylinreg import LinearModel
 
 
-import_module('pylinreg')
 __all__ = ['LinearModel']
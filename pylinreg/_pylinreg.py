@@ -21,9 +21,230 @@ __status__ = 'Alpha'
 
 # import section
 # standard library
+from array import array
+from collections import namedtuple
 from datetime import datetime
-from math import sqrt
-from statistics import mean
+from itertools import islice
+from math import fsum, isnan, nan, sqrt
+from operator import mul
+import sys
+
+
+# Verbose message with timestamp, same as '%Y.%m.%d %H:%M:%S.%f' without
+# parsing a strftime format for every message
+_PRINTOUT_TEMPLATE = '[{:04d}.{:02d}.{:02d} {:02d}:{:02d}:{:02d}.{:06d}] {}'
+
+
+def _clean_none(predictors, targets, replace_none):
+    """
+    Replace or remove None values and convert values to arrays
+    ==========================================================
+
+    Parameters
+    ----------
+    predictors : list, tuple
+        Values of predictor (independent) variables.
+    targets : list, tuple
+        Values of target (dependent) variables.
+    replace_none : boolean
+        Whether to replace none value with the mean of data or not. If not,
+        the exact pair, that contains None value, will be removed.
+
+    Returns
+    -------
+    tuple
+        array('d') of predictors and targets without None.
+    """
+
+    # Check None to replace or remove invalid values
+    # This helps to avoid calculation errors
+    if replace_none:
+        predictors = _replace_none(predictors)
+        targets = _replace_none(targets)
+    else:
+        predictors, targets = _drop_none(predictors, targets)
+
+    return array('d', predictors), array('d', targets)
+
+
+def _drop_none(predictors, targets):
+    """
+    Remove the pairs that contain None value
+    ========================================
+
+    Parameters
+    ----------
+    predictors : list, tuple
+        Values of predictor (independent) variables.
+    targets : list, tuple
+        Values of target (dependent) variables.
+
+    Returns
+    -------
+    tuple
+        Lists of predictors and targets without the removed pairs.
+    """
+
+    # Keep only the pairs without None in one pass, so the indices are not
+    # shifted by earlier removals
+    keep_ids = [idx for idx, (predictor, target)
+                in enumerate(zip(predictors, targets))
+                if predictor is not None and target is not None]
+
+    return ([predictors[idx] for idx in keep_ids],
+            [targets[idx] for idx in keep_ids])
+
+
+def _fit_numeric(predictors, targets):
+    """
+    Calculate the regression variables from numeric values
+    ======================================================
+
+    Parameters
+    ----------
+    predictors : list, tuple
+        Values of predictor (independent) variables. Must not contain None.
+    targets : list, tuple
+        Values of target (dependent) variables. Must not contain None.
+
+    Returns
+    -------
+    tuple
+        x_mean, y_mean, slope, intercept and r-Pearson of the model.
+
+    Raises
+    ------
+    ValueError
+        If predictors and targets are empty.
+    """
+
+    # Exact means are summed with fsum() in C, then the values are centered
+    # in Python into two temporary lists and their products are reduced in
+    # C. The centered sums keep the precision of data with large offset,
+    # which a single pass over raw sums would lose
+    count = len(predictors)
+    if count == 0:
+        raise ValueError('Predictors and targets must contain at least one value')
+    x_mean = fsum(predictors) / count
+    y_mean = fsum(targets) / count
+    x_diffs = [predictor - x_mean for predictor in predictors]
+    y_diffs = [target - y_mean for target in targets]
+    sum_x_diff_sqr = sum(map(mul, x_diffs, x_diffs))
+    sum_y_diff_sqr = sum(map(mul, y_diffs, y_diffs))
+    sum_x_y_diff_mult = sum(map(mul, x_diffs, y_diffs))
+
+    # Regression calculation
+    slope = sum_x_y_diff_mult / sum_x_diff_sqr
+    intercept = y_mean - (slope * x_mean)
+    # r is derived from the slope, so the ratio of the two deviation sums is
+    # taken instead of their product, which is less sensitive to their scale
+    if sum_y_diff_sqr > 0:
+        r = slope * sqrt(sum_x_diff_sqr / sum_y_diff_sqr)
+    else:
+        # Constant targets have no correlation
+        r = nan
+
+    return x_mean, y_mean, slope, intercept, r
+
+
+def _is_double_buffer(values):
+    """
+    Check whether values are a one dimensional float64 buffer
+    =========================================================
+
+    Parameters
+    ----------
+    values : list, tuple, array.array, numpy.ndarray
+        Values of predictor or target variables.
+
+    Returns
+    -------
+    boolean
+        True for one dimensional, contiguous float64 buffers (eg.
+        array.array('d') or numpy.ndarray), False for anything else.
+
+    Notes
+    -----
+    NaN is the missing value only in these buffers, in other values it
+    remains a number.
+    """
+
+    if isinstance(values, (list, tuple)):
+        return False
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return False
+
+    return view.format == 'd' and view.ndim == 1 and view.c_contiguous
+
+
+def _replace_none(values):
+    """
+    Replace None values with the mean of the other values
+    =====================================================
+
+    Parameters
+    ----------
+    values : list, tuple
+        Values of predictor or target variables.
+
+    Returns
+    -------
+    list
+        Values where None is replaced with the mean.
+
+    Raises
+    ------
+    ValueError
+        If all values are None.
+    """
+
+    present = [value for value in values if value is not None]
+    if not present:
+        raise ValueError('Mean of values cannot be calculated, all values are None')
+    values_mean = fsum(present) / len(present)
+
+    return [values_mean if value is None else value for value in values]
+
+
+def _to_doubles(values):
+    """
+    Convert values to array of C doubles
+    ====================================
+
+    Parameters
+    ----------
+    values : list, tuple, array.array, numpy.ndarray
+        Values of predictor or target variables.
+
+    Returns
+    -------
+    array.array
+        array('d') values are returned as they are, other one dimensional
+        float64 buffers (eg. numpy.ndarray) are copied at once and other
+        values are converted value by value.
+
+    Raises
+    ------
+    TypeError
+        If values contain None (or any other non-numeric value).
+    """
+
+    if isinstance(values, array) and values.typecode == 'd':
+        return values
+    if not _is_double_buffer(values):
+        return array('d', values)
+
+    doubles = array('d')
+    doubles.frombytes(memoryview(values).cast('B'))
+
+    return doubles
+
+
+# Slope and intercept of one target column calculated by
+# LinearModel.fit_batch()
+Regression = namedtuple('Regression', ['slope', 'intercept'])
 
 
 class LinearModel():
@@ -31,6 +252,11 @@ class LinearModel():
     LinearModel object contains model data and calculates regression variables
     """
 
+    # Model variables are plain attributes, so reading them (eg. in
+    # make_prediction) does not go through a property
+    __slots__ = ('predictors', 'targets', 'slope', 'intercept', 'x_mean',
+                 'y_mean', 'r')
+
     def __init__(self, predictors=None, targets=None, replace_none=True):
         """
         Initialize the LinearModel object
@@ -38,16 +264,23 @@ class LinearModel():
 
         Attributes
         ----------
-        predictors : list, tuple
+        predictors : list, tuple, array.array, numpy.ndarray
             Values of predictor (independent) variables for linear regression
             model calculation.
-        targets : list, tuple
+        targets : list, tuple, array.array, numpy.ndarray
             Values of target (dependent) variables for linear regression model
             calculation.
         replace_none : boolean
             Whether to replace none value with the mean of data or not. If not,
             the exact pair, that contains None value, will be removed.
+            In float64 arrays NaN is handled the same way as None.
             Default: True
+        slope, intercept : float
+            Slope and intercept of the calculated regression line.
+        x_mean, y_mean : float
+            Mean value of predictors (x) and targets (y).
+        r : float
+            Pearson correlation coefficient of the model.
 
         Methods
         -------
@@ -65,187 +298,189 @@ class LinearModel():
         if len(predictors) != len(targets):
             raise ValueError('Length of predictors must be equal with the length of targets')
 
-        self.__predictors = predictors
-        self.__targets = targets
-        self.__pairs = []
-
-        # Check None to replace or remove invalid values
-        # This helps to avoid calculation errors
-        if None in self.__predictors:
-            if replace_none:
-                _temp_predictors = []
-                _replaceable_ids = []
-                for idx, predictor in enumerate(self.__predictors):
-                    if predictor is None:
-                        _replaceable_ids.append(idx)
-                    else:
-                        _temp_predictors.append(predictor)
-                _temp_mean = mean(_temp_predictors)
-                for replace_id in _replaceable_ids:
-                    self.__predictors[replace_id] = _temp_mean
-                del _temp_predictors
-                del _replaceable_ids
-                del _temp_mean
-            else:
-                _removable_ids = []
-                for idx, predictor in enumerate(self.__predictors):
-                    if predictor is None:
-                        _removable_ids.append(idx)
-                for removable_id in _removable_ids:
-                    self.__predictors.pop(removable_id)
-                    self.__targets.pop(removable_id)
-                del _removable_ids
-
-        if None in self.__targets:
-            if replace_none:
-                _temp_targets = []
-                _replaceable_ids = []
-                for idx, target in enumerate(self.__targets):
-                    if target is None:
-                        _replaceable_ids.append(idx)
-                    else:
-                        _temp_targets.append(target)
-                _temp_mean = mean(_temp_targets)
-                for replace_id in _replaceable_ids:
-                    self.__targets[replace_id] = _temp_mean
-                del _temp_targets
-                del _replaceable_ids
-                del _temp_mean
-            else:
-                _removable_ids = []
-                for idx, target in enumerate(self.__targets):
-                    if target is None:
-                        _removable_ids.append(idx)
-                for removable_id in _removable_ids:
-                    self.__targets.pop(removable_id)
-                    self.__predictors.pop(removable_id)
-                del _removable_ids
-
-        self.__x_mean = mean(self.__predictors)
-        self.__y_mean = mean(self.__targets)
-
-        sum_x_diff_sqr = 0
-        sum_x_y_diff_mult = 0
-        sum_y_diff_sqr = 0
-
-        # Create pairs and other important variables for regression calculation
-        for pair in zip(self.__predictors, self.__targets):
-            self.__pairs.append([pair[0], pair[1]])
-            x_diff = pair[0] - self.__x_mean
-            y_diff = pair[1] - self.__y_mean
-            x_y_diff_mult = x_diff * y_diff
-            sum_x_y_diff_mult += x_y_diff_mult
-            x_diff_sqr = x_diff ** 2
-            sum_x_diff_sqr += x_diff_sqr
-            y_diff_sqr = y_diff ** 2
-            sum_y_diff_sqr += y_diff_sqr
-
-        # Regression calculation
-        self.__slope = sum_x_y_diff_mult / sum_x_diff_sqr
-        self.__intercept = self.__y_mean - (self.__slope * self.__x_mean)
-        self.__r = sum_x_y_diff_mult / (sqrt(sum_x_diff_sqr) * sqrt(sum_y_diff_sqr))
+        self.predictors = predictors
+        self.targets = targets
 
+        self._clean_and_fit(replace_none)
 
-    @property
-    def details(self):
+
+    def _clean_and_fit(self, replace_none):
         """
-        Print the model's most important variables such as:
-        pedictors, targets, pairs, x_mean, y_mean, r-Person, slope, intercept
+        Replace or remove None values and calculate the regression variables
+        ====================================================================
+
+        Parameters
+        ----------
+        replace_none : boolean
+            Whether to replace none value with the mean of data or not. If not,
+            the exact pair, that contains None value, will be removed.
         """
 
-        if self.__slope and self.intercept is not None:
-            if len(self.__predictors) > 10:
-                print('{:>10}: {} (x)'.format('predictors', self.__predictors[:10]))
-                print('{:>10}: {} (y)'.format('targets', self.__targets[:10]))
-            else:
-                print('{:>10}: (x) {}'.format('predictors', self.__predictors))
-                print('{:>10}: (y) {}'.format('targets', self.__targets))
-            print('{:>10}: {}'.format('pairs', self.__pairs[:5]))
-            print('{:>10}: {:8.4f}'.format('x mean', self.__x_mean))
-            print('{:>10}: {:8.4f}'.format('y mean', self.__y_mean))
-            print('{:>10}: {:8.4f}'.format('r-Pearson', self.__r))
-            print('{:>10}: {:8.4f}'.format('slope', self.__slope))
-            print('{:>10}: {:8.4f}'.format('intercept', self.__intercept))
-        else:
-            print('{:>10}: (x) {}'.format('predictors', self.__predictors))
-            print('{:>10}: (y) {}'.format('targets', self.__targets))
-            print('{:>10}: {}'.format('pairs', self.__pairs[:5]))
-            print('{:>10}: {}'.format('x mean', self.__x_mean))
-            print('{:>10}: {}'.format('y mean', self.__y_mean))
-            print('{:>10}: {}'.format('r-Pearson', self.__r))
-            print('{:>10}: {}'.format('slope', self.__slope))
-            print('{:>10}: {}'.format('intercept', self.__intercept))
+        # NaN is the missing value of float64 buffers (eg. numpy.ndarray)
+        nan_predictors = _is_double_buffer(self.predictors)
+        nan_targets = _is_double_buffer(self.targets)
+
+        # Convert values to arrays of C doubles instead of lists of float
+        # objects to keep the memory footprint of the model small
+        # The conversion fails on None, so clean values are not scanned twice
+        try:
+            self.predictors = _to_doubles(self.predictors)
+            self.targets = _to_doubles(self.targets)
+        except TypeError:
+            self.predictors, self.targets = _clean_none(
+                self.predictors, self.targets, replace_none)
+
+        regression = _fit_numeric(self.predictors, self.targets)
+        # NaN turns the means into NaN, so it is found in the buffers without
+        # scanning the values again
+        if ((nan_predictors and isnan(regression[0])) or
+                (nan_targets and isnan(regression[1]))):
+            if nan_predictors:
+                self.predictors = [None if isnan(predictor) else predictor
+                                   for predictor in self.predictors]
+            if nan_targets:
+                self.targets = [None if isnan(target) else target
+                                for target in self.targets]
+            self.predictors, self.targets = _clean_none(
+                self.predictors, self.targets, replace_none)
+            regression = _fit_numeric(self.predictors, self.targets)
+
+        (self.x_mean, self.y_mean, self.slope, self.intercept,
+         self.r) = regression
 
 
     @property
-    def intercept(self):
+    def details(self):
         """
-        Return with the value of intercept.
+        Print the model's most important variables such as:
+        pedictors, targets, pairs, x_mean, y_mean, r-Person, slope, intercept
         """
 
-        return self.__intercept
+        # Only the printed pairs are created, not every pair
+        if self.predictors is None or self.targets is None:
+            first_pairs = []
+        else:
+            first_pairs = list(map(
+                list, islice(zip(self.predictors, self.targets), 5)))
+
+        # Lines are collected and written at once instead of printing them
+        # one by one
+        if self.slope is not None and self.intercept is not None:
+            if len(self.predictors) > 10:
+                lines = ['{:>10}: {} (x)'.format('predictors', list(self.predictors[:10])),
+                         '{:>10}: {} (y)'.format('targets', list(self.targets[:10]))]
+            else:
+                lines = ['{:>10}: (x) {}'.format('predictors', list(self.predictors)),
+                         '{:>10}: (y) {}'.format('targets', list(self.targets))]
+            lines.extend([
+                '{:>10}: {}'.format('pairs', first_pairs),
+                '{:>10}: {:8.4f}'.format('x mean', self.x_mean),
+                '{:>10}: {:8.4f}'.format('y mean', self.y_mean),
+                '{:>10}: {:8.4f}'.format('r-Pearson', self.r),
+                '{:>10}: {:8.4f}'.format('slope', self.slope),
+                '{:>10}: {:8.4f}'.format('intercept', self.intercept)])
+        else:
+            lines = ['{:>10}: (x) {}'.format('predictors', self.predictors
+                                             if self.predictors is None
+                                             else list(self.predictors)),
+                     '{:>10}: (y) {}'.format('targets', self.targets
+                                             if self.targets is None
+                                             else list(self.targets)),
+                     '{:>10}: {}'.format('pairs', first_pairs),
+                     '{:>10}: {}'.format('x mean', self.x_mean),
+                     '{:>10}: {}'.format('y mean', self.y_mean),
+                     '{:>10}: {}'.format('r-Pearson', self.r),
+                     '{:>10}: {}'.format('slope', self.slope),
+                     '{:>10}: {}'.format('intercept', self.intercept)]
+
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 
     @property
     def pairs(self):
         """
         Return with the values of pairs.
-        """
-        return self.__pairs
-
-
-    @property
-    def predictors(self):
-        """
-        Return with the values of predictors.
-        """
-
-        return self.__predictors
 
-
-    @property
-    def r(self):
-        """
-        Return with the value of r.
+        Pairs are not stored, they are created from predictors and targets
+        on every access.
         """
 
-        return self.__r
+        if self.predictors is None or self.targets is None:
+            return []
+        return [[predictor, target] for predictor, target
+                in zip(self.predictors, self.targets)]
 
 
-    @property
-    def slope(self):
-        """
-        Return with the value of slope.
+    @classmethod
+    def fit_batch(cls, predictors, targets):
         """
+        Calculate slope and intercept for more targets with the same
+        predictors at once
+        ================================================================
 
-        return self.__slope
-
-
-    @property
-    def targets(self):
-        """
-        Return with the values of targets.
-        """
+        Parameters
+        ----------
+        predictors : list, tuple, array.array, numpy.ndarray
+            Values of predictor (independent) variables, shared by every
+            target column.
+        targets : list, tuple, numpy.ndarray
+            Rows of target (dependent) values, one row for each predictor
+            and one column for each model. Eg: [[10, 15], [20, 25], [30, 35]]
 
-        return self.__targets
+        Returns
+        -------
+        list of Regression
+            Slope and intercept for each target column in the same order as
+            the columns.
 
+        Raises
+        ------
+        ValueError
+            If the length of predictors and the number of target rows are not
+            equal, the rows of targets have different length or any value is
+            not numeric (eg. None) or NaN.
 
-    @property
-    def x_mean(self):
-        """
-        Return with the mean value of x (predictors).
+        Notes
+        -----
+        Values must be numeric and not NaN. The predictor deviations and
+        their sum of squares are calculated only once for all columns,
+        instead of creating a LinearModel object for every column.
         """
 
-        return self.__x_mean
-
-
-    @property
-    def y_mean(self):
-        """
-        Return with the mean value of y (targets).
-        """
+        if len(predictors) != len(targets):
+            raise ValueError('Length of predictors must be equal with the length of targets')
 
-        return self.__y_mean
+        # zip() would cut every column to the shortest row
+        if len(set(map(len, targets))) > 1:
+            raise ValueError('Every row of targets must have the same length')
+
+        try:
+            predictors = _to_doubles(predictors)
+        except TypeError as error:
+            raise ValueError('Predictors must contain only numeric values') from error
+        count = len(predictors)
+        if count == 0:
+            raise ValueError('Predictors and targets must contain at least one value')
+        x_mean = fsum(predictors) / count
+        if isnan(x_mean):
+            raise ValueError('Predictors must not contain NaN')
+        x_diffs = [predictor - x_mean for predictor in predictors]
+        sum_x_diff_sqr = sum(map(mul, x_diffs, x_diffs))
+
+        regressions = []
+        for column in zip(*targets):
+            try:
+                y_mean = fsum(column) / count
+            except TypeError as error:
+                raise ValueError('Targets must contain only numeric values') from error
+            if isnan(y_mean):
+                raise ValueError('Targets must not contain NaN')
+            y_diffs = [target - y_mean for target in column]
+            slope = sum(map(mul, x_diffs, y_diffs)) / sum_x_diff_sqr
+            intercept = y_mean - (slope * x_mean)
+            regressions.append(Regression(slope, intercept))
+
+        return regressions
 
 
     @classmethod
@@ -268,11 +503,9 @@ class LinearModel():
         LinearModel object
         """
 
-        predictors = []
-        targets = []
-        for pair in pairs:
-            predictors.append(pair[0])
-            targets.append(pair[1])
+        # Unzip the pairs in C instead of appending values one by one
+        columns = tuple(zip(*pairs))
+        predictors, targets = columns[:2] if columns else ((), ())
 
         return cls(predictors, targets)
 
@@ -284,7 +517,7 @@ class LinearModel():
 
         Parameters
         ----------
-        targets : list, tuple
+        predictors : list, tuple
             Values of predictor (independent) variables for linear regression
             model calculation. It is same as the argument of LinearModel object
             with similar name.
@@ -303,20 +536,23 @@ class LinearModel():
             If the length of new predictors and targets are not equal.
         """
 
-        self.__predictors = predictors
+        # Float64 buffers are copied at once, other values are converted by
+        # recalculate() after None handling
+        if _is_double_buffer(predictors):
+            predictors = _to_doubles(predictors)
+
+        # Check the length before changing the model, so it remains valid
+        # when the new values are rejected
+        if self.targets is not None and len(predictors) != len(self.targets):
+            raise ValueError('Length of predictors must be equal with the length of targets')
+
+        self.predictors = predictors
         if verbose:
             self.printout('{} value(s) added as predictors.'
                           .format(len(predictors)))
-        if self.__targets is not None:
-            if len(self.__predictors) == len(self.__targets):
-                _pairs = zip(self.__predictors, self.__targets)
-                for pair in _pairs:
-                    self.__pairs.append([pair[0], pair[1]])
-                if verbose:
-                    self.printout('{} pair(s) created.'
-                                  .format(len(self.__pairs)))
-            else:
-                raise ValueError('Length of predictors must be equal with the length of targets')
+            if self.targets is not None:
+                self.printout('{} pair(s) created.'
+                              .format(len(predictors)))
 
 
     def add_targets(self, targets, verbose=False):
@@ -326,7 +562,7 @@ class LinearModel():
 
         Parameters
         ----------
-        predictors : list, tuple
+        targets : list, tuple
             Values of target (dependent) variables for linear regression model
             calculation. It is same as the argument of LinearModel object with
             similar name.
@@ -344,20 +580,24 @@ class LinearModel():
         ValueError
             If the length of new targets and predictors are not equal.
         """
-        self.__targets = targets
+
+        # Float64 buffers are copied at once, other values are converted by
+        # recalculate() after None handling
+        if _is_double_buffer(targets):
+            targets = _to_doubles(targets)
+
+        # Check the length before changing the model, so it remains valid
+        # when the new values are rejected
+        if self.predictors is not None and len(self.predictors) != len(targets):
+            raise ValueError('Length of predictors must be equal with the length of targets')
+
+        self.targets = targets
         if verbose:
             self.printout('{} value(s) added as targets.'
                           .format(len(targets)))
-        if self.__predictors is not None:
-            if len(self.__predictors) == len(self.__targets):
-                _pairs = zip(self.__predictors, self.__targets)
-                for pair in _pairs:
-                    self.__pairs.append([pair[0], pair[1]])
-                if verbose:
-                    self.printout('{} pair(s) created.'
-                                  .format(len(self.__pairs)))
-            else:
-                raise ValueError('Length of predictors must be equal with the length of targets')
+            if self.predictors is not None:
+                self.printout('{} pair(s) created.'
+                              .format(len(targets)))
 
 
     def make_prediction(self, predictor):
@@ -387,11 +627,46 @@ class LinearModel():
         LinearModel with new variables and make a new calculation.
         """
 
-        if self.__slope and self.intercept is not None:
-            return (self.__slope * predictor) + self.__intercept
+        if self.slope is not None and self.intercept is not None:
+            return (self.slope * predictor) + self.intercept
+        else:
+            raise ValueError('Slope and intercept shouldn\'t be None. Slope is {}, intercept is {}'
+                             .format(self.slope, self.intercept))
+
+
+    def make_predictions(self, predictors):
+        """
+        Make predictions based on the given predictors
+        ==============================================
+
+        Parameters
+        ----------
+        predictors : list, tuple
+            Predictor (independent) values for predictions
+
+        Returns
+        -------
+        predictions : list
+            Values of predictions in the same order as the predictors
+
+        Raises
+        ------
+        ValueError
+            If the slope or intercept values are None.
+
+        Notes
+        -----
+        Same as calling make_prediction() for every predictor, but the slope
+        and intercept are read and checked only once.
+        """
+
+        slope = self.slope
+        intercept = self.intercept
+        if slope is not None and intercept is not None:
+            return [(slope * predictor) + intercept for predictor in predictors]
         else:
             raise ValueError('Slope and intercept shouldn\'t be None. Slope is {}, intercept is {}'
-                             .format(self.__slope, self.__intercept))
+                             .format(slope, intercept))
 
 
     def printout(self, message):
@@ -399,9 +674,11 @@ class LinearModel():
         Help to print verbose message with the actual and formatted timestamp
         """
 
-        time = datetime.now().strftime('%Y.%m.%d %H:%M:%S.%f')
+        now = datetime.now()
 
-        print('[{}] {}'.format(time, message))
+        print(_PRINTOUT_TEMPLATE.format(now.year, now.month, now.day, now.hour,
+                                        now.minute, now.second,
+                                        now.microsecond, message))
 
 
     def recalculate(self, replace_none=True):
@@ -418,85 +695,10 @@ class LinearModel():
 
         Returns
         -------
-        prediction : float
-            Value of prediction
+        None
         """
 
-        # Check None to replace or remove invalid values
-        # This helps to avoid calculation errors
-        if None in self.__predictors:
-            if replace_none:
-                _temp_predictors = []
-                _replaceable_ids = []
-                for idx, predictor in enumerate(self.__predictors):
-                    if predictor is None:
-                        _replaceable_ids.append(idx)
-                    else:
-                        _temp_predictors.append(predictor)
-                _temp_mean = mean(_temp_predictors)
-                for replace_id in _replaceable_ids:
-                    self.__predictors[replace_id] = _temp_mean
-                del _temp_predictors
-                del _replaceable_ids
-                del _temp_mean
-            else:
-                _removable_ids = []
-                for idx, predictor in enumerate(self.__predictors):
-                    if predictor is None:
-                        _removable_ids.append(idx)
-                for removable_id in _removable_ids:
-                    self.__predictors.pop(removable_id)
-                    self.__targets.pop(removable_id)
-                del _removable_ids
-
-        if None in self.__targets:
-            if replace_none:
-                _temp_targets = []
-                _replaceable_ids = []
-                for idx, target in enumerate(self.__targets):
-                    if target is None:
-                        _replaceable_ids.append(idx)
-                    else:
-                        _temp_targets.append(target)
-                _temp_mean = mean(_temp_targets)
-                for replace_id in _replaceable_ids:
-                    self.__targets[replace_id] = _temp_mean
-                del _temp_targets
-                del _replaceable_ids
-                del _temp_mean
-            else:
-                _removable_ids = []
-                for idx, target in enumerate(self.__targets):
-                    if target is None:
-                        _removable_ids.append(idx)
-                for removable_id in _removable_ids:
-                    self.__targets.pop(removable_id)
-                    self.__predictors.pop(removable_id)
-                del _removable_ids
-
-        self.__x_mean = mean(self.__predictors)
-        self.__y_mean = mean(self.__targets)
-
-        sum_x_diff_sqr = 0
-        sum_x_y_diff_mult = 0
-        sum_y_diff_sqr = 0
-
-        # Create pairs and other important variables for regression calculation
-        for pair in zip(self.__predictors, self.__targets):
-            self.__pairs.append([pair[0], pair[1]])
-            x_diff = pair[0] - self.__x_mean
-            y_diff = pair[1] - self.__y_mean
-            x_y_diff_mult = x_diff * y_diff
-            sum_x_y_diff_mult += x_y_diff_mult
-            x_diff_sqr = x_diff ** 2
-            sum_x_diff_sqr += x_diff_sqr
-            y_diff_sqr = y_diff ** 2
-            sum_y_diff_sqr += y_diff_sqr
-
-        # Regression calculation
-        self.__slope = sum_x_y_diff_mult / sum_x_diff_sqr
-        self.__intercept = self.__y_mean - (self.__slope * self.__x_mean)
-        self.__r = sum_x_y_diff_mult / (sqrt(sum_x_diff_sqr) * sqrt(sum_y_diff_sqr))
+        self._clean_and_fit(replace_none)
 
 
     def reset(self, verbose=False):
@@ -514,24 +716,23 @@ class LinearModel():
         Notes
         -----
         The following variables will be None:
-            self.__predictors, self.__targets, self.__slope, self.__intercept,
-            self.__x_mean, self.__y_mean, self.__r
-        The following variables will be default (other than None):
-            self.__pairs : empty list
+            self.predictors, self.targets, self.slope, self.intercept,
+            self.x_mean, self.y_mean, self.r
+        Pairs are created from predictors and targets, so they will be an
+        empty list.
 
         Returns
         -------
         None
         """
 
-        self.__predictors = None
-        self.__targets = None
-        self.__pairs = []
-        self.__slope = None
-        self.__intercept = None
-        self.__x_mean = None
-        self.__y_mean = None
-        self.__r = None
+        self.predictors = None
+        self.targets = None
+        self.slope = None
+        self.intercept = None
+        self.x_mean = None
+        self.y_mean = None
+        self.r = None
         if verbose:
             self.printout('Variables are set to None or default.')
 
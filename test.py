@@ -117,6 +117,63 @@ Model3 = pylinreg.LinearModel(dummy_predictors_3, dummy_targets_3)
 Model3.details
 
 
+
+# Example 6
+print('\nExample 6')
+# make predictions for more predictors at once
+predictors = [1.85, 1.92, 2.00]
+predictions = Model.make_predictions(predictors)
+for predictor, prediction in zip(predictors, predictions):
+    print('{:>10}: {:8.4f}'.format(predictor, prediction))
+
+
+
+# Example 7
+print('\nExample 7')
+# calculate more models with the same predictors at once
+# each row contains the targets of the models for one predictor
+dummy_target_rows = [[target, target + 5.0] for target in dummy_targets]
+regressions = pylinreg.LinearModel.fit_batch(dummy_predictors,
+                                             dummy_target_rows)
+for regression in regressions:
+    print('{:>10}: {:8.4f}'.format('slope', regression.slope))
+    print('{:>10}: {:8.4f}'.format('intercept', regression.intercept))
+
+
+
+# Example 8
+print('\nExample 8')
+# remove every pair that contains None value instead of replacing it
+# the remaining pairs lie on the line of 10 * x + 5
+dummy_predictors_4 = [None, 1, 2, None, 3, 4, 5]
+dummy_targets_4 = [10, 15, 25, 35, None, 45, 55]
+Model4 = pylinreg.LinearModel(dummy_predictors_4, dummy_targets_4,
+                              replace_none=False)
+# pairs with None are removed: [[1.0, 15.0], [2.0, 25.0], [4.0, 45.0], [5.0, 55.0]]
+print('{:>10}: {}'.format('pairs', Model4.pairs))
+print('{:>10}: {:8.4f}'.format('slope', Model4.slope))
+print('{:>10}: {:8.4f}'.format('intercept', Model4.intercept))
+
+
+
+# Example 9
+print('\nExample 9')
+# slope of 0.0 is a valid result, prediction can be made with it
+Model5 = pylinreg.LinearModel([1, 2, 3], [5, 4, 5])
+print('{:>10}: {:8.4f}'.format('slope', Model5.slope))
+prediction = Model5.make_prediction(10)
+print('{:>10}: {:8.4f}'.format('prediction', prediction))
+
+
+
+# Example 10
+print('\nExample 10')
+# constant targets have no correlation, r-Pearson is NaN
+Model6 = pylinreg.LinearModel([1, 2, 3], [5, 5, 5])
+print('{:>10}: {:8.4f}'.format('slope', Model6.slope))
+print('{:>10}: {:8.4f}'.format('r-Pearson', Model6.r))
+
+
 """
 Source:
 Example comes from the 'Simple linear regression' Wikipedia article: